@@ -164,6 +164,8 @@ class TuningRecord(Object):
 class Database(Object):
     """The abstract database interface."""
 
+    __slots__ = []
+
     DatabaseType = Union["Database", Literal["json", "memory"]]
 
     def has_workload(self, mod: IRModule) -> bool:
@@ -23,6 +23,9 @@ from tvm._ffi import register_object
 from .. import _ffi_api
 from .database import Database
 
+_WORKLOAD_FILE = "database_workload.json"
+_RECORD_FILE = "database_tuning_record.json"
+
 
 @register_object("meta_schedule.JSONDatabase")
 class JSONDatabase(Database):
@@ -46,6 +49,8 @@ class JSONDatabase(Database):
                             For the definition of the anchor block, see tir/analysis/analysis.py.
     """
 
+    __slots__ = []
+
     path_workload: str
     path_tuning_record: str
 
@@ -76,13 +81,9 @@ class JSONDatabase(Database):
         """
         if work_dir is not None:
             if path_workload is None:
-                path_workload = osp.join(work_dir, "database_workload.json")
+                path_workload = osp.join(work_dir, _WORKLOAD_FILE)
             if path_tuning_record is None:
-                path_tuning_record = osp.join(work_dir, "database_tuning_record.json")
-        if path_workload is None:
-            raise ValueError("`path_workload` is not specified.")
-        if path_tuning_record is None:
-            raise ValueError("`path_tuning_record` is not specified.")
+                path_tuning_record = osp.join(work_dir, _RECORD_FILE)
         self.__init_handle_by_constructor__(
             _ffi_api.DatabaseJSONDatabase,  # type: ignore # pylint: disable=no-member
             path_workload,
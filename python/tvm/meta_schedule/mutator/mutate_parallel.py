@@ -15,11 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 """Mutator that mutates the parallel extent"""
+import operator
+
 from tvm._ffi.registry import register_object
 
 from .. import _ffi_api
 from .mutator import Mutator
 
+_CTOR = _ffi_api.MutatorMutateParallel  # type: ignore # pylint: disable=no-member
+
 
 @register_object("meta_schedule.MutateParallel")
 class MutateParallel(Mutator):
@@ -27,7 +31,4 @@ class MutateParallel(Mutator):
 
     def __init__(self, max_jobs_per_core: int) -> None:
         """Mutator that mutates the parallel extent"""
-        self.__init_handle_by_constructor__(
-            _ffi_api.MutatorMutateParallel,  # type: ignore # pylint: disable=no-member
-            max_jobs_per_core,
-        )
+        self.__init_handle_by_constructor__(_CTOR, operator.index(max_jobs_per_core))
@@ -16,6 +16,15 @@
  * specific language governing permissions and limitations
  * under the License.
  */
+#if !defined(_WIN32)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#include <cerrno>
+#include <cstring>
 #include <set>
 #include <thread>
 #include <unordered_map>
@@ -26,6 +35,99 @@
 namespace tvm {
 namespace meta_schedule {
 
+/*!
+ * \brief Split a buffer into lines, following the semantics of std::getline.
+ * \param data The start of the buffer.
+ * \param size The size of the buffer in bytes.
+ * \return The lines in the buffer, without the trailing newline characters.
+ */
+std::vector<String> SplitLines(const char* data, size_t size) {
+  std::vector<String> lines;
+  size_t begin = 0;
+  while (begin < size) {
+    const void* eol = std::memchr(data + begin, '\n', size - begin);
+    size_t end = eol == nullptr ? size : static_cast<const char*>(eol) - data;
+    lines.push_back(String(std::string(data + begin, end - begin)));
+    begin = end + 1;
+  }
+  return lines;
+}
+
+#if !defined(_WIN32)
+/*! \brief RAII wrapper that closes a file descriptor. */
+class FileDescriptorGuard {
+ public:
+  explicit FileDescriptorGuard(int fd) : fd_(fd) {}
+  ~FileDescriptorGuard() {
+    if (fd_ >= 0) {
+      close(fd_);
+    }
+  }
+  FileDescriptorGuard(const FileDescriptorGuard&) = delete;
+  FileDescriptorGuard& operator=(const FileDescriptorGuard&) = delete;
+
+  int get() const { return fd_; }
+
+ private:
+  int fd_;
+};
+
+/*! \brief RAII wrapper that unmaps a memory-mapped region. */
+class MappedRegionGuard {
+ public:
+  MappedRegionGuard(void* addr, size_t size) : addr_(addr), size_(size) {}
+  ~MappedRegionGuard() {
+    if (addr_ != MAP_FAILED) {
+      munmap(addr_, size_);
+    }
+  }
+  MappedRegionGuard(const MappedRegionGuard&) = delete;
+  MappedRegionGuard& operator=(const MappedRegionGuard&) = delete;
+
+  const char* data() const { return static_cast<const char*>(addr_); }
+
+ private:
+  void* addr_;
+  size_t size_;
+};
+#endif
+
+/*!
+ * \brief Read all lines of a file. On POSIX systems the file is memory-mapped and split in place.
+ * \param path The path to the file.
+ * \param lines The lines read from the file.
+ * \return Whether the file could be opened.
+ */
+bool ReadFileLines(const String& path, std::vector<String>* lines) {
+#if !defined(_WIN32)
+  FileDescriptorGuard fd(open(path.c_str(), O_RDONLY));
+  if (fd.get() < 0) {
+    return false;
+  }
+  struct stat st;
+  CHECK_EQ(fstat(fd.get(), &st), 0) << "ValueError: Cannot stat file: " << path;
+  CHECK(S_ISREG(st.st_mode)) << "ValueError: Not a regular file: " << path;
+  size_t size = static_cast<size_t>(st.st_size);
+  if (size > 0) {
+    MappedRegionGuard region(mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd.get(), 0), size);
+    CHECK(region.data() != MAP_FAILED) << "ValueError: Cannot mmap file: " << path;
+    madvise(const_cast<char*>(region.data()), size, MADV_SEQUENTIAL);
+    *lines = SplitLines(region.data(), size);
+  }
+  return true;
+#else
+  std::ifstream is(path, std::ios::binary | std::ios::ate);
+  if (!is.good()) {
+    return false;
+  }
+  std::string buffer(static_cast<size_t>(is.tellg()), '\0');
+  is.seekg(0);
+  is.read(buffer.data(), buffer.size());
+  *lines = SplitLines(buffer.data(), buffer.size());
+  return true;
+#endif
+}
+
 /*!
  * \brief Read lines from a json file.
  * \param path The path to the json file.
@@ -34,12 +136,8 @@ namespace meta_schedule {
  * \return An array containing lines read from the json file.
  */
 std::vector<ObjectRef> JSONFileReadLines(const String& path, int num_threads, bool allow_missing) {
-  std::ifstream is(path);
-  if (is.good()) {
-    std::vector<String> json_strs;
-    for (std::string str; std::getline(is, str);) {
-      json_strs.push_back(str);
-    }
+  std::vector<String> json_strs;
+  if (ReadFileLines(path, &json_strs)) {
     int n = json_strs.size();
     std::vector<ObjectRef> json_objs;
     json_objs.resize(n);
@@ -60,9 +158,28 @@ std::vector<ObjectRef> JSONFileReadLines(const String& path, int num_threads, bo
  * \param line The line to append.
  */
 void JSONFileAppendLine(const String& path, const std::string& line) {
+#if !defined(_WIN32)
+  // Issue the line and its newline as one O_APPEND write, so that each record costs a single
+  // write syscall and concurrent writers cannot interleave partial records.
+  std::string buffer = line + '\n';
+  FileDescriptorGuard fd(open(path.c_str(), O_WRONLY | O_APPEND | O_CREAT, 0666));
+  CHECK_GE(fd.get(), 0) << "ValueError: Cannot open the file to write: " << path;
+  const char* data = buffer.data();
+  size_t remaining = buffer.size();
+  while (remaining > 0) {
+    ssize_t written = write(fd.get(), data, remaining);
+    if (written < 0 && errno == EINTR) {
+      continue;
+    }
+    CHECK_GT(written, 0) << "ValueError: Cannot write to file: " << path;
+    data += written;
+    remaining -= written;
+  }
+#else
   std::ofstream os(path, std::ofstream::app);
   CHECK(os.good()) << "ValueError: Cannot open the file to write: " << path;
   os << line << std::endl;
+#endif
 }
 
 /*! \brief The default database implementation, which mimics two database tables with two files. */
@@ -156,6 +273,8 @@ class JSONDatabaseNode : public DatabaseNode {
 
 Database Database::JSONDatabase(String path_workload, String path_tuning_record, bool allow_missing,
                                 String mod_eq_name) {
+  CHECK(!path_workload.empty()) << "ValueError: `path_workload` is empty.";
+  CHECK(!path_tuning_record.empty()) << "ValueError: `path_tuning_record` is empty.";
   int num_threads = std::thread::hardware_concurrency();
   ObjectPtr<JSONDatabaseNode> n = make_object<JSONDatabaseNode>(mod_eq_name);
   // Load `n->workloads2idx_` from `path_workload`
@@ -215,7 +334,14 @@ Database Database::JSONDatabase(String path_workload, String path_tuning_record,
 }
 
 TVM_REGISTER_NODE_TYPE(JSONDatabaseNode);
-TVM_REGISTER_GLOBAL("meta_schedule.DatabaseJSONDatabase").set_body_typed(Database::JSONDatabase);
+TVM_REGISTER_GLOBAL("meta_schedule.DatabaseJSONDatabase")
+    .set_body_typed([](Optional<String> path_workload, Optional<String> path_tuning_record,
+                       bool allow_missing, String mod_eq_name) {
+      CHECK(path_workload.defined()) << "ValueError: `path_workload` is not specified.";
+      CHECK(path_tuning_record.defined()) << "ValueError: `path_tuning_record` is not specified.";
+      return Database::JSONDatabase(path_workload.value(), path_tuning_record.value(),
+                                    allow_missing, mod_eq_name);
+    });
 
 }  // namespace meta_schedule
 }  // namespace tvm
@@ -16,7 +16,9 @@
 # under the License.
 # pylint: disable=missing-module-docstring,missing-function-docstring,missing-class-docstring
 """Test Meta Schedule Database"""
+import os
 import os.path as osp
+import pathlib
 import tempfile
 from typing import Callable, List, Optional
 
@@ -250,6 +252,41 @@ def test_meta_schedule_database_create():
         assert osp.exists(database.path_tuning_record)
 
 
+def test_meta_schedule_database_work_dir(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        expected_workload = osp.join(tmpdir, "database_workload.json")
+        expected_tuning_record = osp.join(tmpdir, "database_tuning_record.json")
+        for work_dir in [tmpdir, tmpdir + os.sep, pathlib.Path(tmpdir)]:
+            database = ms.database.JSONDatabase(work_dir=work_dir)
+            assert database.path_workload == expected_workload
+            assert database.path_tuning_record == expected_tuning_record
+        with monkeypatch.context() as m:
+            m.chdir(tmpdir)
+            database = ms.database.JSONDatabase(work_dir="")
+            assert database.path_workload == "database_workload.json"
+            assert database.path_tuning_record == "database_tuning_record.json"
+            assert osp.isfile(expected_workload)
+            assert osp.isfile(expected_tuning_record)
+
+
+def test_meta_schedule_database_missing_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path_workload = osp.join(tmpdir, "workloads.json")
+        path_tuning_record = osp.join(tmpdir, "tuning_records.json")
+        with pytest.raises(ValueError, match="path_workload"):
+            ms.database.JSONDatabase()
+        with pytest.raises(ValueError, match="path_tuning_record"):
+            ms.database.JSONDatabase(path_workload=path_workload)
+        with pytest.raises(ValueError, match="path_workload"):
+            ms.database.JSONDatabase(path_tuning_record=path_tuning_record)
+        with pytest.raises(ValueError, match="path_workload"):
+            ms.database.JSONDatabase("", path_tuning_record)
+        with pytest.raises(ValueError, match="path_tuning_record"):
+            ms.database.JSONDatabase(path_workload, "")
+        assert not osp.exists(path_workload)
+        assert not osp.exists(path_tuning_record)
+
+
 def test_meta_schedule_database_has_workload():
     mod: IRModule = Matmul
     missing_mod: IRModule = MatmulRelu
@@ -414,6 +451,51 @@ def test_meta_schedule_database_reload():
             _equal_record(ret[1], records[2])
 
 
+def test_meta_schedule_database_reload_no_trailing_newline():
+    mod: IRModule = Matmul
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = _create_tmp_database(tmpdir)
+        token = database.commit_workload(mod)
+        trace = _create_schedule(mod, _schedule_matmul).trace
+        records = [
+            ms.database.TuningRecord(
+                trace,
+                token,
+                [float(i)],
+                tvm.target.Target("llvm"),
+                ms.arg_info.ArgInfo.from_prim_func(func=mod["main"]),
+            )
+            for i in range(2)
+        ]
+        for record in records:
+            database.commit_tuning_record(record)
+        # Strip the newline after the last line of both files
+        for path in [database.path_workload, database.path_tuning_record]:
+            with open(path, "r", encoding="utf-8") as file:
+                content = file.read()
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(content.rstrip("\n"))
+        new_database = ms.database.JSONDatabase(
+            path_workload=database.path_workload,
+            path_tuning_record=database.path_tuning_record,
+        )
+        assert len(new_database) == 2
+        token = new_database.commit_workload(mod)
+        ret = new_database.get_top_k(token, 2)
+        assert len(ret) == 2
+        _equal_record(ret[0], records[0])
+        _equal_record(ret[1], records[1])
+
+
+def test_meta_schedule_database_reload_directory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(ValueError):
+            ms.database.JSONDatabase(
+                path_workload=tmpdir,
+                path_tuning_record=osp.join(tmpdir, "tuning_records.json"),
+            )
+
+
 def test_meta_schedule_database_union():
     mod: IRModule = Matmul
     target = tvm.target.Target("llvm")